@@ -1,12 +1,77 @@
 """Template search and loading utilities for Langflow."""
 
-import json
+import os
+import threading
 from pathlib import Path
 from typing import Any
 
 import orjson
 from lfx.log.logger import logger
 
+# The most recently loaded (directory, signature of its JSON files, parsed templates). Starter projects
+# only change on deploy, so re-parsing them on every call is wasted work. Keeping a single entry means
+# arbitrary caller paths cannot grow the cache.
+_template_cache: tuple[Path, tuple[tuple[str, int, int], ...], list[dict[str, Any]]] | None = None
+_TEMPLATE_CACHE_LOCK = threading.Lock()
+# Shared read-only default for templates without tags
+_EMPTY_LIST: list[str] = []
+
+
+def _directory_signature(starter_projects_dir: Path) -> tuple[tuple[str, int, int], ...]:
+    """Return a (name, mtime_ns, size) tuple for every JSON file in the directory."""
+    signature = []
+    if not starter_projects_dir.is_dir():
+        return ()
+    with os.scandir(starter_projects_dir) as entries:
+        for entry in entries:
+            if entry.name.endswith(".json") and entry.is_file():
+                stat = entry.stat()
+                signature.append((entry.name, stat.st_mtime_ns, stat.st_size))
+    return tuple(sorted(signature))
+
+
+def _load_template(template_file: Path) -> dict[str, Any] | None:
+    """Read and parse a single template file, returning None if it is not valid JSON."""
+    try:
+        return orjson.loads(template_file.read_bytes())
+    except orjson.JSONDecodeError as e:
+        # Log and skip invalid JSON files
+        logger.warning(f"Failed to parse {template_file}: {e}")
+        return None
+
+
+def _load_templates(starter_projects_dir: Path) -> list[dict[str, Any]]:
+    """Load every template in the directory, reusing the cached copy while the files are unchanged.
+
+    The returned dictionaries are shared between callers and must be treated as read-only.
+    """
+    global _template_cache  # noqa: PLW0603
+
+    signature = _directory_signature(starter_projects_dir)
+    if not signature:
+        # Nothing to load, and nothing worth keeping in the cache
+        return []
+
+    cached = _template_cache
+    if cached is not None and cached[0] == starter_projects_dir and cached[1] == signature:
+        return cached[2]
+
+    with _TEMPLATE_CACHE_LOCK:
+        # Another thread may have populated the cache while we were waiting for the lock
+        cached = _template_cache
+        if cached is not None and cached[0] == starter_projects_dir and cached[1] == signature:
+            return cached[2]
+
+        # The signature already lists the JSON files sorted by name, so there is no need to glob again
+        templates = [
+            template
+            for name, _, _ in signature
+            if (template := _load_template(starter_projects_dir / name)) is not None
+        ]
+
+        _template_cache = (starter_projects_dir, signature, templates)
+        return templates
+
 
 def list_templates(
     query: str | None = None,
@@ -57,45 +122,36 @@ def list_templates(
         raise FileNotFoundError(msg)
 
     results = []
-
-    # Iterate through all JSON files in the directory
-    for template_file in starter_projects_dir.glob("*.json"):
-        try:
-            # Load the template
-            with Path(template_file).open(encoding="utf-8") as f:
-                template_data = json.load(f)
-
-            # Apply search filter if provided
-            if query:
-                name = template_data.get("name", "").lower()
-                description = template_data.get("description", "").lower()
-                query_lower = query.lower()
-
-                if query_lower not in name and query_lower not in description:
-                    continue
-
-            # Apply tag filter if provided
-            if tags:
-                template_tags = template_data.get("tags", [])
-                if not template_tags:
-                    continue
-                # Check if any of the provided tags match
-                if not any(tag in template_tags for tag in tags):
-                    continue
-
-            # Extract only the requested fields
-            if fields:
-                filtered_data = {field: template_data.get(field) for field in fields if field in template_data}
-            else:
-                # Return all fields if none specified
-                filtered_data = template_data
-
-            results.append(filtered_data)
-
-        except (json.JSONDecodeError, orjson.JSONDecodeError) as e:
-            # Log and skip invalid JSON files
-            logger.warning(f"Failed to parse {template_file}: {e}")
-            continue
+    # Normalize the search term once rather than for every template
+    query_lower = query.lower() if query else None
+
+    # Iterate through all templates in the directory
+    for template_data in _load_templates(starter_projects_dir):
+        # Apply search filter if provided
+        if query_lower:
+            name = template_data.get("name", "").lower()
+            description = template_data.get("description", "").lower()
+
+            if query_lower not in name and query_lower not in description:
+                continue
+
+        # Apply tag filter if provided
+        if tags:
+            template_tags = template_data.get("tags", _EMPTY_LIST)
+            if not template_tags:
+                continue
+            # Check if any of the provided tags match
+            if not any(tag in template_tags for tag in tags):
+                continue
+
+        # Extract only the requested fields
+        if fields:
+            filtered_data = {field: template_data.get(field) for field in fields if field in template_data}
+        else:
+            # Return all fields if none specified
+            filtered_data = dict(template_data)
+
+        results.append(filtered_data)
 
     return results
 
@@ -126,18 +182,11 @@ def get_template_by_id(
     else:
         starter_projects_dir = Path(__file__).parent.parent.parent / "initial_setup" / "starter_projects"
 
-    for template_file in starter_projects_dir.glob("*.json"):
-        try:
-            with Path(template_file).open(encoding="utf-8") as f:
-                template_data = json.load(f)
-
-            if template_data.get("id") == template_id:
-                if fields:
-                    return {field: template_data.get(field) for field in fields if field in template_data}
-                return template_data
-
-        except (json.JSONDecodeError, orjson.JSONDecodeError):
-            continue
+    for template_data in _load_templates(starter_projects_dir):
+        if template_data.get("id") == template_id:
+            if fields:
+                return {field: template_data.get(field) for field in fields if field in template_data}
+            return dict(template_data)
 
     return None
 
@@ -162,16 +211,9 @@ def get_all_tags(starter_projects_path: str | Path | None = None) -> list[str]:
         starter_projects_dir = Path(__file__).parent.parent.parent / "initial_setup" / "starter_projects"
     all_tags = set()
 
-    for template_file in starter_projects_dir.glob("*.json"):
-        try:
-            template_data = orjson.loads(Path(template_file).read_text(encoding="utf-8"))
-
-            tags = template_data.get("tags", [])
-            all_tags.update(tags)
-
-        except (json.JSONDecodeError, orjson.JSONDecodeError) as e:
-            logger.aexception(f"Error loading template {template_file}: {e}")
-            continue
+    for template_data in _load_templates(starter_projects_dir):
+        tags = template_data.get("tags", _EMPTY_LIST)
+        all_tags.update(tags)
 
     return sorted(all_tags)
 
@@ -189,4 +231,4 @@ def get_templates_count(starter_projects_path: str | Path | None = None) -> int:
         starter_projects_dir = Path(starter_projects_path)
     else:
         starter_projects_dir = Path(__file__).parent.parent.parent / "initial_setup" / "starter_projects"
-    return len(list(starter_projects_dir.glob("*.json")))
+    return len(_directory_signature(starter_projects_dir))
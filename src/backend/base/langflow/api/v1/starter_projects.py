@@ -1,7 +1,8 @@
+import asyncio
 from typing import Any
 
-from fastapi import APIRouter, Depends, HTTPException
-from pydantic import BaseModel
+from fastapi import APIRouter, Depends, HTTPException, Response
+from pydantic import BaseModel, TypeAdapter
 
 from langflow.services.auth.utils import get_current_active_user
 
@@ -41,35 +42,68 @@ class GraphDumpResponse(BaseModel):
     endpoint_name: str | None = None
 
 
-@router.get("/", dependencies=[Depends(get_current_active_user)], status_code=200)
-async def get_starter_projects() -> list[GraphDumpResponse]:
-    """Get a list of starter projects."""
+_GRAPH_DUMP_LIST_ADAPTER = TypeAdapter(list[GraphDumpResponse])
+
+# Shared read-only defaults for missing keys, so lookups don't allocate a fresh container each time
+_EMPTY: dict[str, Any] = {}
+_EMPTY_LIST: list[dict[str, Any]] = []
+
+# Starter projects only change on deploy, so the serialized response is built once per process
+starter_projects_content: bytes | None = None
+starter_projects_lock = asyncio.Lock()
+
+
+def _dump_starter_projects() -> bytes:
     from langflow.initial_setup.load import get_starter_projects_dump
 
-    try:
-        # Get the raw data from lfx GraphDump
-        raw_data = get_starter_projects_dump()
-
-        # Convert TypedDict GraphDump to Pydantic GraphDumpResponse
-        results = []
-        for item in raw_data:
-            # Create GraphData
-            graph_data = GraphData(
-                nodes=item.get("data", {}).get("nodes", []),
-                edges=item.get("data", {}).get("edges", []),
-                viewport=item.get("data", {}).get("viewport"),
-            )
-
-            # Create GraphDumpResponse
-            graph_dump = GraphDumpResponse(
-                data=graph_data,
-                is_component=item.get("is_component"),
-                name=item.get("name"),
-                description=item.get("description"),
-                endpoint_name=item.get("endpoint_name"),
-            )
-            results.append(graph_dump)
-
-    except Exception as exc:
-        raise HTTPException(status_code=500, detail=str(exc)) from exc
-    return results
+    # Get the raw data from lfx GraphDump
+    raw_data = get_starter_projects_dump()
+
+    # Convert TypedDict GraphDump to Pydantic GraphDumpResponse
+    results = []
+    # The dump comes from our own starter graphs, so the models are constructed without validation
+    for item in raw_data:
+        data = item.get("data", _EMPTY)
+        viewport = data.get("viewport")
+        # Create GraphData
+        graph_data = GraphData.model_construct(
+            nodes=data.get("nodes", _EMPTY_LIST),
+            edges=data.get("edges", _EMPTY_LIST),
+            viewport=ViewPort.model_construct(**viewport) if viewport else None,
+        )
+
+        # Create GraphDumpResponse
+        graph_dump = GraphDumpResponse.model_construct(
+            data=graph_data,
+            is_component=item.get("is_component"),
+            name=item.get("name"),
+            description=item.get("description"),
+            endpoint_name=item.get("endpoint_name"),
+        )
+        results.append(graph_dump)
+
+    # Serialize the models in a single pass. Returning them would make FastAPI validate
+    # and encode every node and edge dict again before rendering the response.
+    return _GRAPH_DUMP_LIST_ADAPTER.dump_json(results)
+
+
+@router.get(
+    "/",
+    dependencies=[Depends(get_current_active_user)],
+    status_code=200,
+    response_model=list[GraphDumpResponse],
+)
+async def get_starter_projects() -> Response:
+    """Get a list of starter projects."""
+    global starter_projects_content  # noqa: PLW0603
+
+    if starter_projects_content is None:
+        async with starter_projects_lock:
+            # Another request may have built the content while we were waiting for the lock.
+            # The build runs in a worker thread so it does not block the event loop.
+            if starter_projects_content is None:
+                try:
+                    starter_projects_content = await asyncio.to_thread(_dump_starter_projects)
+                except Exception as exc:
+                    raise HTTPException(status_code=500, detail=str(exc)) from exc
+    return Response(content=starter_projects_content, media_type="application/json")
@@ -22,6 +22,10 @@ if TYPE_CHECKING:
     from langflow.events.event_manager import EventManager
 
 
+# Sentinel for attribute lookups where None is a meaningful value
+_MISSING = object()
+
+
 def instantiate_class(
     vertex: Vertex,
     user_id=None,
@@ -116,10 +120,26 @@ async def update_params_with_load_from_db_fields(
     fallback_to_env_vars=False,
 ):
     async with session_scope() as session:
+        # Resolve every field in one lookup; anything it misses goes through get_variable below
+        field_map = {field: params[field] for field in load_from_db_fields if params.get(field)}
+        prefetched: dict[str, Any] = {}
+        if field_map:
+            try:
+                prefetched = await custom_component.get_variables_bulk(field_map=field_map, session=session)
+            except ValueError as e:
+                if "User id is not set" in str(e):
+                    raise
+                await logger.adebug(str(e))
+
         for field in load_from_db_fields:
             if field not in params or not params[field]:
                 continue
 
+            # A None override still needs the environment fallback and warning below
+            if prefetched.get(params[field]) is not None:
+                params[field] = prefetched[params[field]]
+                continue
+
             try:
                 key = await custom_component.get_variable(name=params[field], field=field, session=session)
             except ValueError as e:
@@ -180,11 +200,14 @@ async def build_custom_component(params: dict, custom_component: CustomComponent
     if not isinstance(custom_repr, str):
         custom_repr = str(custom_repr)
     raw = custom_component.repr_value
-    if hasattr(raw, "data") and raw is not None:
-        raw = raw.data
-
-    elif hasattr(raw, "model_dump") and raw is not None:
-        raw = raw.model_dump()
+    if raw is not None:
+        data = getattr(raw, "data", _MISSING)
+        if data is not _MISSING:
+            raw = data
+        else:
+            model_dump = getattr(raw, "model_dump", None)
+            if model_dump is not None:
+                raw = model_dump()
     if raw is None and isinstance(build_result, dict | Data | str):
         raw = build_result.data if isinstance(build_result, Data) else build_result
 
@@ -194,8 +217,9 @@ async def build_custom_component(params: dict, custom_component: CustomComponent
 
     vertex = custom_component.get_vertex()
     if vertex is not None:
-        custom_component.set_artifacts({vertex.outputs[0].get("name"): artifact})
-        custom_component.set_results({vertex.outputs[0].get("name"): build_result})
+        output_name = vertex.outputs[0].get("name")
+        custom_component.set_artifacts({output_name: artifact})
+        custom_component.set_results({output_name: build_result})
         return custom_component, build_result, artifact
 
     msg = "Custom component does not have a vertex"
@@ -35,6 +35,27 @@ class VariableService(Service):
             The value of the variable.
         """
 
+    async def get_variables_bulk(
+        self,
+        user_id: UUID | str,  # noqa: ARG002
+        field_map: dict[str, str],  # noqa: ARG002
+        session: AsyncSession,  # noqa: ARG002
+    ) -> dict[str, str]:
+        """Async get several variable values at once.
+
+        Implementations that cannot fetch in bulk return an empty dictionary, and callers fall back to
+        get_variable for every variable that is missing from the result.
+
+        Args:
+            user_id: The user ID.
+            field_map: A mapping of field names to the names of the variables they reference.
+            session: The database session.
+
+        Returns:
+            A dictionary mapping variable names to the values that could be resolved.
+        """
+        return {}
+
     @abc.abstractmethod
     async def list_variables(self, user_id: UUID | str, session: AsyncSession) -> list[str | None]:
         """List all variables.
@@ -5,7 +5,7 @@ from datetime import datetime, timezone
 from typing import TYPE_CHECKING
 
 from lfx.log.logger import logger
-from sqlmodel import select
+from sqlmodel import col, select
 from typing_extensions import override
 
 from langflow.services.auth import utils as auth_utils
@@ -103,6 +103,29 @@ class DatabaseVariableService(VariableService, Service):
         # we decrypt the value
         return auth_utils.decrypt_api_key(variable.value, settings_service=self.settings_service)
 
+    async def get_variables_bulk(
+        self,
+        user_id: UUID | str,
+        field_map: dict[str, str],
+        session: AsyncSession,
+    ) -> dict[str, str]:
+        names = set(field_map.values())
+        if not names:
+            return {}
+        session_id_names = {name for field, name in field_map.items() if field == "session_id"}
+        stmt = select(Variable).where(Variable.user_id == user_id, col(Variable.name).in_(names))
+        variables = (await session.exec(stmt)).all()
+
+        values = {}
+        for variable in variables:
+            if not variable.value:
+                continue
+            # Credentials requested for a Session ID field are left out so that get_variable reports the error
+            if variable.type == CREDENTIAL_TYPE and variable.name in session_id_names:
+                continue
+            values[variable.name] = auth_utils.decrypt_api_key(variable.value, settings_service=self.settings_service)
+        return values
+
     async def get_all(self, user_id: UUID | str, session: AsyncSession) -> list[VariableRead]:
         stmt = select(Variable).where(Variable.user_id == user_id)
         variables = list((await session.exec(stmt)).all())
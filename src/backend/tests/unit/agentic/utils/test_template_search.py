@@ -1,6 +1,8 @@
 """Unit tests for template_search module using real templates."""
 
 import tempfile
+from pathlib import Path
+from unittest.mock import patch
 
 import pytest
 from langflow.agentic.utils import (
@@ -9,6 +11,7 @@ from langflow.agentic.utils import (
     get_templates_count,
     list_templates,
 )
+from langflow.agentic.utils.template_search import _load_template
 
 
 class TestListTemplates:
@@ -484,6 +487,40 @@ class TestPerformance:
 
         assert ids1 == ids2 == ids3
 
+    def test_cache_invalidated_when_template_changes(self):
+        """Test that editing a template on disk is picked up by the next call."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            template_path = Path(tmpdir) / "template.json"
+            template_path.write_text('{"id": "1", "name": "Before"}', encoding="utf-8")
+            assert list_templates(fields=["name"], starter_projects_path=tmpdir) == [{"name": "Before"}]
+
+            template_path.write_text('{"id": "1", "name": "After edit"}', encoding="utf-8")
+            assert list_templates(fields=["name"], starter_projects_path=tmpdir) == [{"name": "After edit"}]
+
+            (Path(tmpdir) / "other.json").write_text('{"id": "2", "name": "Other"}', encoding="utf-8")
+            assert get_templates_count(starter_projects_path=tmpdir) == 2
+            assert len(list_templates(starter_projects_path=tmpdir)) == 2
+
+    def test_cache_keeps_only_latest_directory(self):
+        """Test that loading templates from another directory replaces the cached entry."""
+        with tempfile.TemporaryDirectory() as first_dir, tempfile.TemporaryDirectory() as second_dir:
+            (Path(first_dir) / "first.json").write_text('{"id": "1", "name": "First"}', encoding="utf-8")
+            (Path(second_dir) / "second.json").write_text('{"id": "2", "name": "Second"}', encoding="utf-8")
+
+            with patch(
+                "langflow.agentic.utils.template_search._load_template", wraps=_load_template
+            ) as mock_load_template:
+                assert list_templates(fields=["name"], starter_projects_path=first_dir) == [{"name": "First"}]
+                assert list_templates(fields=["name"], starter_projects_path=first_dir) == [{"name": "First"}]
+                assert mock_load_template.call_count == 1
+
+                assert list_templates(fields=["name"], starter_projects_path=second_dir) == [{"name": "Second"}]
+                assert mock_load_template.call_count == 2
+
+                # The second directory replaced the first, so loading the first again re-parses it
+                assert list_templates(fields=["name"], starter_projects_path=first_dir) == [{"name": "First"}]
+                assert mock_load_template.call_count == 3
+
 
 class TestIntegrationScenarios:
     """Test realistic integration scenarios."""
@@ -1,3 +1,5 @@
+from unittest.mock import patch
+
 from fastapi import status
 from httpx import AsyncClient
 
@@ -8,3 +10,36 @@ async def test_get_starter_projects(client: AsyncClient, logged_in_headers):
 
     assert response.status_code == status.HTTP_200_OK, response.text
     assert isinstance(result, list), "The result must be a list"
+
+
+async def test_get_starter_projects_builds_once(client: AsyncClient, logged_in_headers):
+    dump = [{"name": "Starter", "description": "", "is_component": False, "data": {"nodes": [], "edges": []}}]
+    with (
+        patch("langflow.api.v1.starter_projects.starter_projects_content", None),
+        patch("langflow.initial_setup.load.get_starter_projects_dump", return_value=dump) as mock_dump,
+    ):
+        first = await client.get("api/v1/starter-projects/", headers=logged_in_headers)
+        second = await client.get("api/v1/starter-projects/", headers=logged_in_headers)
+
+    assert first.status_code == status.HTTP_200_OK, first.text
+    assert second.status_code == status.HTTP_200_OK, second.text
+    assert first.json() == second.json()
+    assert first.json()[0]["name"] == "Starter"
+    mock_dump.assert_called_once()
+
+
+async def test_get_starter_projects_does_not_cache_failure(client: AsyncClient, logged_in_headers):
+    dump = [{"name": "Starter", "description": "", "is_component": False, "data": {"nodes": [], "edges": []}}]
+    with (
+        patch("langflow.api.v1.starter_projects.starter_projects_content", None),
+        patch(
+            "langflow.initial_setup.load.get_starter_projects_dump", side_effect=[RuntimeError("boom"), dump]
+        ) as mock_dump,
+    ):
+        failed = await client.get("api/v1/starter-projects/", headers=logged_in_headers)
+        retried = await client.get("api/v1/starter-projects/", headers=logged_in_headers)
+
+    assert failed.status_code == status.HTTP_500_INTERNAL_SERVER_ERROR
+    assert retried.status_code == status.HTTP_200_OK, retried.text
+    assert retried.json()[0]["name"] == "Starter"
+    assert mock_dump.call_count == 2
@@ -1,8 +1,11 @@
 import os
-from unittest.mock import AsyncMock, MagicMock, patch
+from unittest.mock import ANY, AsyncMock, MagicMock, patch
 
 import pytest
+from lfx.custom import validate
 from lfx.interface.initialize.loading import (
+    _COMPILED_COMPONENT_CACHE,
+    get_component_class,
     update_params_with_load_from_db_fields,
     update_table_params_with_load_from_db_fields,
 )
@@ -19,6 +22,7 @@ async def test_update_params_fallback_to_env_when_variable_not_found():
 
     # Create mock custom component
     custom_component = MagicMock()
+    custom_component.get_variables_bulk = AsyncMock(return_value={})
     # Change this error message to avoid triggering re-raise
     custom_component.get_variable = AsyncMock(side_effect=ValueError("Database connection failed"))
 
@@ -49,6 +53,7 @@ async def test_update_params_raises_when_variable_not_found_and_no_fallback():
     """
     # Create mock custom component
     custom_component = MagicMock()
+    custom_component.get_variables_bulk = AsyncMock(return_value={})
     custom_component.get_variable = AsyncMock(side_effect=ValueError("TEST_API_KEY variable not found."))
 
     # Set up params
@@ -76,6 +81,7 @@ async def test_update_params_uses_database_variable_when_found():
 
     # Create mock custom component
     custom_component = MagicMock()
+    custom_component.get_variables_bulk = AsyncMock(return_value={})
     custom_component.get_variable = AsyncMock(return_value="db-value")
 
     # Set up params
@@ -109,6 +115,7 @@ async def test_update_params_sets_none_when_no_env_var_and_fallback_enabled():
 
     # Create mock custom component
     custom_component = MagicMock()
+    custom_component.get_variables_bulk = AsyncMock(return_value={})
     # Change this error message to avoid triggering re-raise
     custom_component.get_variable = AsyncMock(side_effect=ValueError("Database connection failed"))
 
@@ -133,6 +140,7 @@ async def test_update_params_raises_on_user_id_not_set():
     """Test that 'User id is not set' error is always raised regardless of fallback setting."""
     # Create mock custom component
     custom_component = MagicMock()
+    custom_component.get_variables_bulk = AsyncMock(return_value={})
     custom_component.get_variable = AsyncMock(side_effect=ValueError("User id is not set"))
 
     # Set up params
@@ -163,6 +171,7 @@ async def test_update_params_skips_empty_fields():
     """Test that empty or None fields in params are skipped."""
     # Create mock custom component
     custom_component = MagicMock()
+    custom_component.get_variables_bulk = AsyncMock(return_value={})
     custom_component.get_variable = AsyncMock(return_value="some-value")
 
     # Set up params with empty and None values
@@ -198,6 +207,7 @@ async def test_update_params_handles_multiple_fields():
 
     # Create mock custom component
     custom_component = MagicMock()
+    custom_component.get_variables_bulk = AsyncMock(return_value={})
 
     # Set up different responses for different fields
     async def mock_get_variable(name, **_kwargs):
@@ -245,6 +255,61 @@ async def test_update_params_handles_multiple_fields():
     del os.environ["ENV_KEY"]
 
 
+@pytest.mark.asyncio
+async def test_update_params_uses_bulk_lookup():
+    """Test that fields resolved by the bulk lookup skip the per-field get_variable call.
+
+    Fields the bulk lookup misses still go through get_variable.
+    """
+    custom_component = MagicMock()
+    custom_component.get_variables_bulk = AsyncMock(return_value={"DB_KEY": "db-value", "OTHER_KEY": "other-value"})
+    custom_component.get_variable = AsyncMock(return_value="single-value")
+
+    params = {"field1": "DB_KEY", "field2": "OTHER_KEY", "field3": "SINGLE_KEY", "field4": ""}
+    load_from_db_fields = ["field1", "field2", "field3", "field4"]
+
+    with patch("lfx.interface.initialize.loading.session_scope") as mock_session_scope:
+        mock_session_scope.return_value.__aenter__.return_value = MagicMock()
+
+        result = await update_params_with_load_from_db_fields(
+            custom_component, params, load_from_db_fields, fallback_to_env_vars=False
+        )
+
+    assert result["field1"] == "db-value"
+    assert result["field2"] == "other-value"
+    assert result["field3"] == "single-value"
+    assert result["field4"] == ""
+
+    custom_component.get_variables_bulk.assert_called_once_with(
+        field_map={"field1": "DB_KEY", "field2": "OTHER_KEY", "field3": "SINGLE_KEY"}, session=ANY
+    )
+    custom_component.get_variable.assert_called_once_with(name="SINGLE_KEY", field="field3", session=ANY)
+
+
+@pytest.mark.asyncio
+async def test_update_params_bulk_none_value_falls_back_to_env():
+    """Test that a None value from the bulk lookup still goes through the environment fallback."""
+    custom_component = MagicMock()
+    custom_component.get_variables_bulk = AsyncMock(return_value={"NONE_KEY": None})
+    custom_component.get_variable = AsyncMock(return_value=None)
+
+    params = {"field1": "NONE_KEY"}
+    load_from_db_fields = ["field1"]
+
+    with (
+        patch("lfx.interface.initialize.loading.session_scope") as mock_session_scope,
+        patch.dict(os.environ, {"NONE_KEY": "env-value"}),
+    ):
+        mock_session_scope.return_value.__aenter__.return_value = MagicMock()
+
+        result = await update_params_with_load_from_db_fields(
+            custom_component, params, load_from_db_fields, fallback_to_env_vars=True
+        )
+
+    assert result["field1"] == "env-value"
+    custom_component.get_variable.assert_called_once_with(name="NONE_KEY", field="field1", session=ANY)
+
+
 # =====================================================================================
 # TABLE LOAD_FROM_DB TESTS
 # =====================================================================================
@@ -461,6 +526,7 @@ async def test_update_params_with_table_fields():
 
     # Create mock custom component
     custom_component = MagicMock()
+    custom_component.get_variables_bulk = AsyncMock(return_value={})
 
     async def mock_get_variable(name, **_kwargs):
         if name == "REGULAR_VAR":
@@ -523,3 +589,56 @@ async def test_update_table_params_handles_user_id_not_set_error():
             await update_table_params_with_load_from_db_fields(
                 custom_component, params, "table_data", fallback_to_env_vars=True
             )
+
+
+def test_get_component_class_compiles_once_and_builds_fresh_classes():
+    """Test that identical source is compiled once but every call gets its own class and namespace."""
+    code = (
+        "from lfx.custom.custom_component.component import Component\n"
+        "from lfx.io import MessageTextInput\n\n\n"
+        "class CachedComponent(Component):\n"
+        '    inputs = [MessageTextInput(name="text")]\n'
+    )
+
+    with (
+        patch.dict(_COMPILED_COMPONENT_CACHE, clear=True),
+        patch("lfx.interface.initialize.loading.validate.compile_class", wraps=validate.compile_class) as mock_compile,
+    ):
+        first_class = get_component_class(code)
+        second_class = get_component_class(code)
+
+    assert mock_compile.call_count == 1
+    assert first_class is not second_class
+
+    # Class-level state must not leak between instances built from the same source
+    first_class()._get_or_create_input("leaked_from_user1")
+    assert [component_input.name for component_input in second_class().inputs] == ["text"]
+
+
+def test_get_component_class_evicts_least_recently_used():
+    """Test that a recently used compilation survives eviction while the least recently used one is dropped."""
+    codes = [
+        (
+            "from lfx.custom.custom_component.component import Component\n\n\n"
+            f"class CachedComponent{index}(Component):\n"
+            "    pass\n"
+        )
+        for index in range(3)
+    ]
+
+    with (
+        patch.dict(_COMPILED_COMPONENT_CACHE, clear=True),
+        patch("lfx.interface.initialize.loading._COMPILED_COMPONENT_CACHE_MAXSIZE", 2),
+        patch("lfx.interface.initialize.loading.validate.compile_class", wraps=validate.compile_class) as mock_compile,
+    ):
+        get_component_class(codes[0])
+        get_component_class(codes[1])
+        # Touch the first source so the second becomes the least recently used
+        get_component_class(codes[0])
+        get_component_class(codes[2])
+        assert mock_compile.call_count == 3
+
+        get_component_class(codes[0])
+        assert mock_compile.call_count == 3
+        get_component_class(codes[1])
+        assert mock_compile.call_count == 4
@@ -99,6 +99,49 @@ async def test_get_variable__typeerror(service, session: AsyncSession):
     assert "purpose is to prevent the exposure of value" in str(exc.value)
 
 
+async def test_get_variables_bulk(service, session: AsyncSession):
+    user_id = uuid4()
+    await service.create_variable(user_id, "name1", "value1", session=session)
+    await service.create_variable(user_id, "name2", "value2", session=session)
+
+    result = await service.get_variables_bulk(
+        user_id, {"field1": "name1", "field2": "name2", "field3": "missing"}, session=session
+    )
+
+    assert result == {"name1": "value1", "name2": "value2"}
+
+
+async def test_get_variables_bulk__skips_empty_value(service, session: AsyncSession):
+    user_id = uuid4()
+    variable = await service.create_variable(user_id, "name", "value", session=session)
+    variable.value = ""
+    session.add(variable)
+    await session.flush()
+
+    result = await service.get_variables_bulk(user_id, {"field": "name"}, session=session)
+
+    assert result == {}
+
+
+async def test_get_variables_bulk__skips_credential_for_session_id(service, session: AsyncSession):
+    user_id = uuid4()
+    await service.create_variable(user_id, "name", "value", type_=CREDENTIAL_TYPE, session=session)
+
+    result = await service.get_variables_bulk(user_id, {"session_id": "name"}, session=session)
+    assert result == {}
+
+    result = await service.get_variables_bulk(user_id, {"api_key": "name"}, session=session)
+    assert result == {"name": "value"}
+
+
+async def test_get_variables_bulk__other_user(service, session: AsyncSession):
+    await service.create_variable(uuid4(), "name", "value", session=session)
+
+    result = await service.get_variables_bulk(uuid4(), {"field": "name"}, session=session)
+
+    assert result == {}
+
+
 async def test_list_variables(service, session: AsyncSession):
     user_id = uuid4()
     names = ["name1", "name2", "name3"]
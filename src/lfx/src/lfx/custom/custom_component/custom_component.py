@@ -452,6 +452,32 @@ class CustomComponent(BaseComponent):
         async with session_scope() as session:
             return await self.get_variable(name, field, session)
 
+    def _check_user_id_is_set(self) -> None:
+        if hasattr(self, "_user_id") and not self.user_id:
+            msg = f"User id is not set for {self.__class__.__name__}"
+            raise ValueError(msg)
+
+    def _request_variable_overrides(self) -> dict[str, Any]:
+        """Returns the request-level variable overrides from the graph context, if any."""
+        if hasattr(self, "graph") and self.graph and hasattr(self.graph, "context"):
+            context = self.graph.context
+            if context and "request_variables" in context:
+                return context["request_variables"]
+        return {}
+
+    def _resolve_user_id(self) -> uuid.UUID:
+        """Returns the current user id as a UUID.
+
+        Raises:
+            TypeError: If the user id is neither a string nor a UUID.
+        """
+        if isinstance(self.user_id, str):
+            return uuid.UUID(self.user_id)
+        if isinstance(self.user_id, uuid.UUID):
+            return self.user_id
+        msg = f"Invalid user id: {self.user_id}"
+        raise TypeError(msg)
+
     async def get_variable(self, name: str, field: str, session):
         """Returns the variable for the current user with the specified name.
 
@@ -461,30 +487,51 @@ class CustomComponent(BaseComponent):
         Returns:
             The variable for the current user with the specified name.
         """
-        if hasattr(self, "_user_id") and not self.user_id:
-            msg = f"User id is not set for {self.__class__.__name__}"
-            raise ValueError(msg)
+        self._check_user_id_is_set()
 
         # Check graph context for request-level variable overrides first
-        if hasattr(self, "graph") and self.graph and hasattr(self.graph, "context"):
-            context = self.graph.context
-            if context and "request_variables" in context:
-                request_variables = context["request_variables"]
-                if name in request_variables:
-                    logger.debug(f"Found context override for variable '{name}': {request_variables[name]}")
-                    return request_variables[name]
+        request_variables = self._request_variable_overrides()
+        if name in request_variables:
+            logger.debug(f"Found context override for variable '{name}': {request_variables[name]}")
+            return request_variables[name]
 
         variable_service = get_variable_service()  # Get service instance
         # Retrieve and decrypt the variable by name for the current user
-        if isinstance(self.user_id, str):
-            user_id = uuid.UUID(self.user_id)
-        elif isinstance(self.user_id, uuid.UUID):
-            user_id = self.user_id
-        else:
-            msg = f"Invalid user id: {self.user_id}"
-            raise TypeError(msg)
+        user_id = self._resolve_user_id()
         return await variable_service.get_variable(user_id=user_id, name=name, field=field, session=session)
 
+    async def get_variables_bulk(self, field_map: dict[str, str], session) -> dict[str, Any]:
+        """Returns the variables referenced by several fields using a single lookup.
+
+        Args:
+            field_map: A mapping of field names to the names of the variables they reference.
+            session: The database session.
+
+        Raises:
+            ValueError: If the user id is not set.
+
+        Returns:
+            A dictionary mapping variable names to their values. Variables that could not be resolved
+            are left out, so callers should fall back to get_variable for them.
+        """
+        self._check_user_id_is_set()
+
+        # Check graph context for request-level variable overrides first
+        request_variables = self._request_variable_overrides()
+        values: dict[str, Any] = {
+            name: request_variables[name] for name in field_map.values() if name in request_variables
+        }
+
+        remaining = {field: name for field, name in field_map.items() if name not in values}
+        variable_service = get_variable_service()
+        get_bulk = getattr(variable_service, "get_variables_bulk", None)
+        if not remaining or get_bulk is None:
+            return values
+
+        user_id = self._resolve_user_id()
+        values.update(await get_bulk(user_id=user_id, field_map=remaining, session=session))
+        return values
+
     async def list_key_names(self):
         """Lists the names of the variables for the current user.
 
@@ -2,8 +2,8 @@ import ast
 import contextlib
 import importlib
 import warnings
-from types import FunctionType
-from typing import Optional, Union
+from types import CodeType, FunctionType
+from typing import NamedTuple, Optional, Union
 
 from langchain_core._api.deprecation import LangChainDeprecationWarning
 from pydantic import ValidationError
@@ -238,6 +238,92 @@ def create_function(code, function_name):
     return wrapped_function
 
 
+class CompiledClass(NamedTuple):
+    """Compiled class source that can be executed into a fresh global scope.
+
+    Only the import statements and code objects are kept, so the parsed module can be freed.
+    """
+
+    imports: list[ast.Import]
+    import_froms: list[ast.ImportFrom]
+    definitions_code: CodeType | None
+    class_code: CodeType
+    class_name: str
+
+
+def _class_creation_error(error: Exception) -> ValueError:
+    """Translate an error raised while creating a class into the ValueError reported to callers."""
+    if isinstance(error, SyntaxError):
+        msg = f"Syntax error in code: {error!s}"
+    elif isinstance(error, NameError):
+        msg = f"Name error (possibly undefined variable): {error!s}"
+    elif isinstance(error, ValidationError):
+        messages = [err["msg"].split(",", 1) for err in error.errors()]
+        msg = "\n".join([message[1] if len(message) > 1 else message[0] for message in messages])
+    else:
+        msg = f"Error creating class. {type(error).__name__}({error!s})."
+    return ValueError(msg)
+
+
+def _prepare_class_source(code: str) -> str:
+    """Rewrite legacy imports and prepend the default imports to the source of a class."""
+    if not hasattr(ast, "TypeIgnore"):
+        ast.TypeIgnore = create_type_ignore_class()
+
+    code = code.replace("from langflow import CustomComponent", "from langflow.custom import CustomComponent")
+    code = code.replace(
+        "from langflow.interface.custom.custom_component import CustomComponent",
+        "from langflow.custom import CustomComponent",
+    )
+
+    return DEFAULT_IMPORT_STRING + "\n" + code
+
+
+def compile_class(code, class_name) -> CompiledClass:
+    """Parse and compile the source of a class without executing it.
+
+    Args:
+        code: String containing the Python code defining the class
+        class_name: Name of the class to be compiled
+
+    Returns:
+        A CompiledClass that build_class can execute any number of times
+
+    Raises:
+        ValueError: If the code contains syntax errors or the class definition is invalid
+    """
+    code = _prepare_class_source(code)
+    try:
+        module = ast.parse(code)
+        imports, import_froms, definitions = _split_module_body(module)
+        class_code = extract_class_code(module, class_name)
+        return CompiledClass(
+            imports=imports,
+            import_froms=import_froms,
+            definitions_code=_compile_definitions(definitions),
+            class_code=compile_class_code(class_code),
+            class_name=class_name,
+        )
+    except Exception as e:
+        raise _class_creation_error(e) from e
+
+
+def build_class(compiled: CompiledClass):
+    """Execute a compiled class into a fresh global scope and return the created class.
+
+    Every call runs the imports and module-level definitions again, so the returned class and its
+    globals are never shared with classes built by previous calls.
+
+    Raises:
+        ValueError: If the imports or the class body fail to execute
+    """
+    try:
+        exec_globals = _build_global_scope(compiled.imports, compiled.import_froms, compiled.definitions_code)
+        return build_class_constructor(compiled.class_code, exec_globals, compiled.class_name)
+    except Exception as e:
+        raise _class_creation_error(e) from e
+
+
 def create_class(code, class_name):
     """Dynamically create a class from a string of code and a specified class name.
 
@@ -251,16 +337,7 @@ def create_class(code, class_name):
     Raises:
         ValueError: If the code contains syntax errors or the class definition is invalid
     """
-    if not hasattr(ast, "TypeIgnore"):
-        ast.TypeIgnore = create_type_ignore_class()
-
-    code = code.replace("from langflow import CustomComponent", "from langflow.custom import CustomComponent")
-    code = code.replace(
-        "from langflow.interface.custom.custom_component import CustomComponent",
-        "from langflow.custom import CustomComponent",
-    )
-
-    code = DEFAULT_IMPORT_STRING + "\n" + code
+    code = _prepare_class_source(code)
     try:
         module = ast.parse(code)
         exec_globals = prepare_global_scope(module)
@@ -269,20 +346,8 @@ def create_class(code, class_name):
         compiled_class = compile_class_code(class_code)
 
         return build_class_constructor(compiled_class, exec_globals, class_name)
-
-    except SyntaxError as e:
-        msg = f"Syntax error in code: {e!s}"
-        raise ValueError(msg) from e
-    except NameError as e:
-        msg = f"Name error (possibly undefined variable): {e!s}"
-        raise ValueError(msg) from e
-    except ValidationError as e:
-        messages = [error["msg"].split(",", 1) for error in e.errors()]
-        error_message = "\n".join([message[1] if len(message) > 1 else message[0] for message in messages])
-        raise ValueError(error_message) from e
     except Exception as e:
-        msg = f"Error creating class. {type(e).__name__}({e!s})."
-        raise ValueError(msg) from e
+        raise _class_creation_error(e) from e
 
 
 def create_type_ignore_class():
@@ -332,7 +397,12 @@ def prepare_global_scope(module):
     Raises:
         ModuleNotFoundError: If a module is not found in the code
     """
-    exec_globals = globals().copy()
+    imports, import_froms, definitions = _split_module_body(module)
+    return _build_global_scope(imports, import_froms, _compile_definitions(definitions))
+
+
+def _split_module_body(module) -> tuple[list[ast.Import], list[ast.ImportFrom], list[ast.stmt]]:
+    """Split a module body into its imports, from-imports and the definitions to execute."""
     imports = []
     import_froms = []
     definitions = []
@@ -345,6 +415,21 @@ def prepare_global_scope(module):
         elif isinstance(node, ast.ClassDef | ast.FunctionDef | ast.Assign):
             definitions.append(node)
 
+    return imports, import_froms, definitions
+
+
+def _compile_definitions(definitions) -> CodeType | None:
+    """Compile the module-level definitions into a single code object, or None if there are none."""
+    if not definitions:
+        return None
+    combined_module = ast.Module(body=definitions, type_ignores=[])
+    return compile(combined_module, "<string>", "exec")
+
+
+def _build_global_scope(imports, import_froms, definitions_code):
+    """Run the imports and the compiled definitions in a fresh copy of this module's globals."""
+    exec_globals = globals().copy()
+
     for node in imports:
         for alias in node.names:
             module_name = alias.name
@@ -391,10 +476,8 @@ def prepare_global_scope(module):
             msg = f"Module {node.module} not found. Please install it and try again"
             raise ModuleNotFoundError(msg)
 
-    if definitions:
-        combined_module = ast.Module(body=definitions, type_ignores=[])
-        compiled_code = compile(combined_module, "<string>", "exec")
-        exec(compiled_code, exec_globals)
+    if definitions_code is not None:
+        exec(definitions_code, exec_globals)
 
     return exec_globals
 
@@ -1,14 +1,17 @@
 from __future__ import annotations
 
+import contextlib
+import hashlib
 import inspect
 import os
 import warnings
+from collections import OrderedDict
 from typing import TYPE_CHECKING, Any
 
 import orjson
 from pydantic import PydanticDeprecatedSince20
 
-from lfx.custom.eval import eval_custom_component_code
+from lfx.custom import validate
 from lfx.log.logger import logger
 from lfx.schema.artifact import get_artifact_type, post_process_raw
 from lfx.schema.data import Data
@@ -25,6 +28,40 @@ if TYPE_CHECKING:
         pass
 
 
+# Components built here still use Pydantic v1 style APIs. The filter is installed once at import rather than
+# wrapping every build in warnings.catch_warnings(), which snapshots the global filter list and is not
+# task-safe around an await anyway.
+warnings.filterwarnings("ignore", category=PydanticDeprecatedSince20)
+
+# Sentinel for attribute lookups where None is a meaningful value
+_MISSING = object()
+
+# Compiled component sources keyed by a digest of the code, least recently used first. A hit skips
+# parsing and compiling; the imports and module-level definitions still run for every new class.
+_COMPILED_COMPONENT_CACHE: OrderedDict[str, validate.CompiledClass] = OrderedDict()
+_COMPILED_COMPONENT_CACHE_MAXSIZE = 512
+
+
+def get_component_class(code: str) -> type[CustomComponent | Component]:
+    """Return a new component class for code, reusing a previous compilation of the same source.
+
+    The compiled code is executed into a fresh namespace on every call, so class-level state and
+    module globals are never shared between instantiations.
+    """
+    code_hash = hashlib.blake2b(code.encode("utf-8"), digest_size=16).hexdigest()
+    compiled = _COMPILED_COMPONENT_CACHE.get(code_hash)
+    if compiled is None:
+        compiled = validate.compile_class(code, validate.extract_class_name(code))
+        _COMPILED_COMPONENT_CACHE[code_hash] = compiled
+        if len(_COMPILED_COMPONENT_CACHE) > _COMPILED_COMPONENT_CACHE_MAXSIZE:
+            _COMPILED_COMPONENT_CACHE.popitem(last=False)
+    else:
+        # Another thread may have evicted the entry since the lookup
+        with contextlib.suppress(KeyError):
+            _COMPILED_COMPONENT_CACHE.move_to_end(code_hash)
+    return validate.build_class(compiled)
+
+
 def instantiate_class(
     vertex: Vertex,
     user_id=None,
@@ -41,7 +78,7 @@ def instantiate_class(
 
     custom_params = get_params(vertex.params)
     code = custom_params.pop("code")
-    class_object: type[CustomComponent | Component] = eval_custom_component_code(code)
+    class_object = get_component_class(code)
     custom_component: CustomComponent | Component = class_object(
         _user_id=user_id,
         _parameters=custom_params,
@@ -68,17 +105,19 @@ async def get_instance_results(
         vertex.load_from_db_fields,
         fallback_to_env_vars=fallback_to_env_vars,
     )
-    with warnings.catch_warnings():
-        warnings.filterwarnings("ignore", category=PydanticDeprecatedSince20)
-        if base_type == "custom_components":
-            return await build_custom_component(params=custom_params, custom_component=custom_component)
-        if base_type == "component":
-            return await build_component(params=custom_params, custom_component=custom_component)
+    builder = _BUILDERS.get(base_type)
+    if builder is None:
         msg = f"Base type {base_type} not found."
         raise ValueError(msg)
+    return await builder(params=custom_params, custom_component=custom_component)
 
 
 def get_params(vertex_params):
+    """Normalize the vertex params and return a copy owned by the caller.
+
+    The copy is required: callers pop "code" from the result and write resolved variable values
+    into it, neither of which may leak back into the vertex params used by later builds.
+    """
     params = vertex_params
     params = convert_params_to_sets(params)
     params = convert_kwargs(params)
@@ -95,18 +134,15 @@ def convert_params_to_sets(params):
 
 
 def convert_kwargs(params):
-    # Loop through items to avoid repeated lookups
-    items_to_remove = []
-    for key, value in params.items():
-        if ("kwargs" in key or "config" in key) and isinstance(value, str):
-            try:
-                params[key] = orjson.loads(value)
-            except orjson.JSONDecodeError:
-                items_to_remove.append(key)
-
-    # Remove invalid keys outside the loop to avoid modifying dict during iteration
-    for key in items_to_remove:
-        params.pop(key, None)
+    # Collect the keys up front so the dict can be modified while we go through them
+    candidates = [
+        key for key, value in params.items() if isinstance(value, str) and ("kwargs" in key or "config" in key)
+    ]
+    for key in candidates:
+        try:
+            params[key] = orjson.loads(params[key])
+        except orjson.JSONDecodeError:
+            params.pop(key, None)
 
     return params
 
@@ -223,6 +259,22 @@ async def update_params_with_load_from_db_fields(
         if is_noop_session:
             logger.debug("Loading variables from environment variables because database is not available.")
             return load_from_env_vars(params, load_from_db_fields)
+
+        # Resolve every regular field in one lookup; anything it misses goes through get_variable below
+        field_map = {
+            field: params[field]
+            for field in load_from_db_fields
+            if not field.startswith("table:") and field in params and params[field]
+        }
+        prefetched: dict[str, Any] = {}
+        if field_map:
+            try:
+                prefetched = await custom_component.get_variables_bulk(field_map=field_map, session=session)
+            except ValueError as e:
+                if "User id is not set" in str(e):
+                    raise
+                logger.debug(str(e))
+
         for field in load_from_db_fields:
             # Check if this is a table field (using our naming convention)
             if field.startswith("table:"):
@@ -238,6 +290,11 @@ async def update_params_with_load_from_db_fields(
                 if field not in params or not params[field]:
                     continue
 
+                # A None override still needs the environment fallback and warning below
+                if prefetched.get(params[field]) is not None:
+                    params[field] = prefetched[params[field]]
+                    continue
+
                 try:
                     key = await custom_component.get_variable(name=params[field], field=field, session=session)
                 except ValueError as e:
@@ -296,11 +353,14 @@ async def build_custom_component(params: dict, custom_component: CustomComponent
     if not isinstance(custom_repr, str):
         custom_repr = str(custom_repr)
     raw = custom_component.repr_value
-    if hasattr(raw, "data") and raw is not None:
-        raw = raw.data
-
-    elif hasattr(raw, "model_dump") and raw is not None:
-        raw = raw.model_dump()
+    if raw is not None:
+        data = getattr(raw, "data", _MISSING)
+        if data is not _MISSING:
+            raw = data
+        else:
+            model_dump = getattr(raw, "model_dump", None)
+            if model_dump is not None:
+                raw = model_dump()
     if raw is None and isinstance(build_result, dict | Data | str):
         raw = build_result.data if isinstance(build_result, Data) else build_result
 
@@ -308,10 +368,19 @@ async def build_custom_component(params: dict, custom_component: CustomComponent
     raw = post_process_raw(raw, artifact_type)
     artifact = {"repr": custom_repr, "raw": raw, "type": artifact_type}
 
-    if custom_component.get_vertex() is not None:
-        custom_component.set_artifacts({custom_component.get_vertex().outputs[0].get("name"): artifact})
-        custom_component.set_results({custom_component.get_vertex().outputs[0].get("name"): build_result})
+    vertex = custom_component.get_vertex()
+    if vertex is not None:
+        output_name = vertex.outputs[0].get("name")
+        custom_component.set_artifacts({output_name: artifact})
+        custom_component.set_results({output_name: build_result})
         return custom_component, build_result, artifact
 
     msg = "Custom component does not have a vertex"
     raise ValueError(msg)
+
+
+# Build functions for each vertex base type, used by get_instance_results
+_BUILDERS = {
+    "custom_components": build_custom_component,
+    "component": build_component,
+}